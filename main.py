@@ -6,20 +6,24 @@ Starts the FastAPI/Uvicorn server with the supervisor orchestrator.
 All agents are accessible through a single domain: app.luvium.online
 """
 
-import asyncio
+import hashlib
 import logging
 import os
+import sys
 from contextlib import asynccontextmanager
 
 try:
-    from fastapi import FastAPI
-    from fastapi.responses import JSONResponse
+    from fastapi import FastAPI, Request
+    from fastapi.responses import ORJSONResponse, Response, StreamingResponse
     from fastapi.middleware.cors import CORSMiddleware
+    import anyio.to_thread
+    import orjson
     import uvicorn
 except ImportError:
     print("FastAPI not installed. Install with: pip install fastapi uvicorn")
     exit(1)
 
+from src.agent_management import result_as_dict
 from src.supervisor import SupervisorOrchestrator
 
 # Configure logging
@@ -32,12 +36,39 @@ logger = logging.getLogger(__name__)
 # Initialize supervisor globally
 supervisor = None
 
+# The root payload is constant for the lifetime of the process
+ROOT_PAYLOAD = orjson.dumps({
+    "status": "online",
+    "service": "Supervisor AI",
+    "version": "0.2.0",
+    "domain": "app.luvium.online"
+})
+ETAG_ROOT = f'"{hashlib.md5(ROOT_PAYLOAD).hexdigest()}"'
+CACHE_CONTROL = "public, max-age=30"
+
+# Health probes only ever see one of two bodies
+HEALTHY_PAYLOAD = orjson.dumps({"status": "healthy", "running": True})
+DEGRADED_PAYLOAD = orjson.dumps({"status": "degraded", "running": False})
+
+
+def cached_json_response(request: Request, payload: bytes, etag: str) -> Response:
+    """Build a cacheable JSON response, or a 304 if the client's copy is current."""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application startup and shutdown."""
     global supervisor
     # Startup
     logger.info("Starting Supervisor AI...")
+    # Raise the worker thread limit (default 40) so sync work reached from
+    # agent tasks cannot starve the threadpool under concurrent requests
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = int(os.getenv("THREADPOOL_SIZE", 200))
     supervisor = SupervisorOrchestrator(name="Luvium-Supervisor")
     await supervisor.start()
     yield
@@ -49,7 +80,8 @@ app = FastAPI(
     title="Supervisor AI",
     description="Multi-agent supervisor system for orchestrating specialized AI agents",
     version="0.2.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS for single domain access: app.luvium.online
@@ -64,48 +96,45 @@ app.add_middleware(
 )
 
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Root endpoint."""
-    return {
-        "status": "online",
-        "service": "Supervisor AI",
-        "version": "0.2.0",
-        "domain": "app.luvium.online"
-    }
+    return cached_json_response(request, ROOT_PAYLOAD, ETAG_ROOT)
+
+async def stream_chunks(chunks):
+    """Adapt a sync iterator of bytes for StreamingResponse without a threadpool hop."""
+    for chunk in chunks:
+        yield chunk
 
 @app.get("/health")
 async def health():
     """Health check endpoint."""
     global supervisor
     if supervisor and supervisor.running:
-        return {"status": "healthy", "running": True}
-    return {"status": "degraded", "running": False}
+        return Response(content=HEALTHY_PAYLOAD, media_type="application/json")
+    return Response(content=DEGRADED_PAYLOAD, media_type="application/json")
 
 @app.get("/status")
 async def status():
     """Get supervisor status."""
     global supervisor
     if supervisor:
-        return supervisor.get_status()
+        return StreamingResponse(
+            stream_chunks(supervisor.iter_status_json()),
+            media_type="application/json"
+        )
     return {"error": "Supervisor not initialized"}
 
 @app.get("/agents/list")
-async def list_agents():
+async def list_agents(request: Request):
     """List all available agents."""
     global supervisor
     if supervisor:
-        agents = supervisor.registry.list_all_agents()
-        return {
-            "total_agents": len(agents),
-            "agents": [
-                {
-                    "id": agent.agent_id,
-                    "name": agent.name,
-                    "capabilities": [cap.value for cap in agent.capabilities]
-                }
-                for agent in agents
-            ]
-        }
+        registry = supervisor.registry
+        return cached_json_response(
+            request,
+            registry.get_agents_list_json(),
+            registry.get_agents_list_etag()
+        )
     return {"error": "Supervisor not initialized"}
 
 @app.post("/task/delegate")
@@ -113,50 +142,68 @@ async def delegate_task(task: dict):
     """Delegate a task to appropriate agent(s)."""
     global supervisor
     if not supervisor:
-        return JSONResponse({"error": "Supervisor not initialized"}, status_code=503)
+        return ORJSONResponse({"error": "Supervisor not initialized"}, status_code=503)
     
     try:
         result = await supervisor.delegate_task(task)
         return result
     except Exception as e:
         logger.error(f"Task delegation failed: {str(e)}")
-        return JSONResponse({"error": str(e)}, status_code=400)
+        return ORJSONResponse({"error": str(e)}, status_code=400)
 
 @app.post("/agent/{agent_name}/task")
 async def submit_agent_task(agent_name: str, task: dict):
     """Submit a task directly to a specific agent by name."""
     global supervisor
     if not supervisor:
-        return JSONResponse({"error": "Supervisor not initialized"}, status_code=503)
+        return ORJSONResponse({"error": "Supervisor not initialized"}, status_code=503)
     
     try:
-        # Find agent by name
-        agents = supervisor.registry.list_all_agents()
-        agent = next((a for a in agents if a.name.lower() == agent_name.lower()), None)
+        agent = supervisor.registry.get_agent_by_name(agent_name)
         
         if not agent:
-            return JSONResponse({"error": f"Agent '{agent_name}' not found"}, status_code=404)
+            return ORJSONResponse({"error": f"Agent '{agent_name}' not found"}, status_code=404)
+        
+        # Actions with a pre-serialized variant skip the response encoder
+        payload = agent.execute_json(task)
+        if payload is not None:
+            return Response(
+                content=b'{"success":true,"agent_id":' + orjson.dumps(agent.agent_id)
+                + b',"agent_name":' + orjson.dumps(agent.name)
+                + b',"result":' + payload + b"}",
+                media_type="application/json"
+            )
         
         result = await agent.execute(task)
         return {
             "success": True,
             "agent_id": agent.agent_id,
             "agent_name": agent.name,
-            "result": result
+            "result": result_as_dict(result)
         }
     except Exception as e:
         logger.error(f"Agent task execution failed: {str(e)}")
-        return JSONResponse({"error": str(e)}, status_code=400)
+        return ORJSONResponse({"error": str(e)}, status_code=400)
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
     host = os.getenv("HOST", "0.0.0.0")
+    reload = os.getenv("ENV", "production") == "development"
+    # One worker process per core; each worker runs its own lifespan and
+    # therefore its own supervisor instance. Reload mode is single-process.
+    workers = 1 if reload else int(os.getenv("WEB_CONCURRENCY", max(2, os.cpu_count() or 2)))
     
-    logger.info(f"Starting Supervisor AI server on {host}:{port}")
+    logger.info(f"Starting Supervisor AI server on {host}:{port} with {workers} worker(s)")
     logger.info(f"Accessible from: https://app.luvium.online")
     uvicorn.run(
         "main:app",
         host=host,
         port=port,
-        reload=os.getenv("ENV", "production") == "development"
+        reload=reload,
+        # uvloop is not available on Windows; fall back to the stdlib loop there
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+        workers=workers,
+        limit_concurrency=1000,
+        timeout_keep_alive=30,
     )
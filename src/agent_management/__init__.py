@@ -5,9 +5,8 @@ Provides core agent management functionality for the Supervisor AI system.
 Includes agent registry, base classes, and orchestration utilities.
 """
 
-from .agent_base import Agent, AgentCapability, AgentState
+from .agent_base import Agent, AgentCapability, AgentState, action, result_as_dict
 from .agent_registry import AgentRegistry
-from .agent_pool import AgentPool
 
 __version__ = "0.1.0"
 __all__ = [
@@ -15,5 +14,6 @@ __all__ = [
     "AgentCapability",
     "AgentState",
     "AgentRegistry",
-    "AgentPool",
+    "action",
+    "result_as_dict",
 ]
@@ -4,13 +4,30 @@ Defines the abstract base class and interfaces for agents in the Supervisor AI s
 Provides standardized agent lifecycle management and capability tracking.
 """
 
-from abc import ABC, abstractmethod
+from abc import ABC
+from functools import lru_cache
+from collections import defaultdict, deque
+from dataclasses import dataclass, field, fields, is_dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Deque, Dict, FrozenSet, List, Optional, Tuple
 from datetime import datetime
-from pydantic import BaseModel, Field
+import asyncio
+import inspect
+import logging
+import os
+import sys
+import time
 import uuid
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of errors kept per agent; older entries are discarded
+ERROR_LOG_MAX = int(os.getenv("AGENT_ERROR_LOG_MAX", 1000))
+
+# Shared, read-only result for tasks whose action has no handler
+_UNKNOWN_ACTION = MappingProxyType({"error": "unknown_action"})
+
 
 class AgentCapability(str, Enum):
     """Enumeration of agent capabilities."""
@@ -22,6 +39,56 @@ class AgentCapability(str, Enum):
     FALLBACK_PROCESSING = "fallback_processing"
     COORDINATION = "coordination"
     REPORTING = "reporting"
+    # Bursary management
+    SCHOLARSHIP_MANAGEMENT = "scholarship_management"
+    APPLICATION_PROCESSING = "application_processing"
+    FUND_DISBURSEMENT = "fund_disbursement"
+    STUDENT_SUPPORT = "student_support"
+    # Financial management
+    FINANCIAL_PLANNING = "financial_planning"
+    DOLIBARR_INTEGRATION = "dolibarr_integration"
+    BUDGET_MANAGEMENT = "budget_management"
+    FINANCIAL_REPORTING = "financial_reporting"
+    # Consulting
+    PROPOSAL_GENERATION = "proposal_generation"
+    SCOPE_DEFINITION = "scope_definition"
+    TIMELINE_PLANNING = "timeline_planning"
+    BUDGET_ESTIMATION = "budget_estimation"
+    # Dealer onboarding
+    DEALER_REGISTRATION = "dealer_registration"
+    IDENTITY_VERIFICATION = "identity_verification"
+    COMPLIANCE_CHECK = "compliance_check"
+    ACCOUNT_SETUP = "account_setup"
+    # Government contracting
+    CONTRACT_MANAGEMENT = "contract_management"
+    COMPLIANCE_TRACKING = "compliance_tracking"
+    PROCUREMENT_ASSISTANCE = "procurement_assistance"
+    BID_PREPARATION = "bid_preparation"
+    # Investment management
+    PORTFOLIO_MANAGEMENT = "portfolio_management"
+    INVESTMENT_ANALYSIS = "investment_analysis"
+    ASSET_ALLOCATION = "asset_allocation"
+    RISK_ASSESSMENT = "risk_assessment"
+    # Marketing
+    CAMPAIGN_MANAGEMENT = "campaign_management"
+    EMAIL_MARKETING = "email_marketing"
+    CONTENT_ANALYSIS = "content_analysis"
+    MULTI_API_INTEGRATION = "multi_api_integration"
+    # Operations
+    PROCESS_OPERATIONS = "process_operations"
+    DOCUMENT_PROCESSING = "document_processing"
+    WORKFLOW_OPTIMIZATION = "workflow_optimization"
+    BYTEZ_INTEGRATION = "bytez_integration"
+    # Pricing
+    PRICE_OPTIMIZATION = "price_optimization"
+    MARKET_ANALYSIS = "market_analysis"
+    COMPETITIVE_POSITIONING = "competitive_positioning"
+    REVENUE_MAXIMIZATION = "revenue_maximization"
+    # Research & development
+    RESEARCH_MANAGEMENT = "research_management"
+    INNOVATION_TRACKING = "innovation_tracking"
+    BYTEZ_DOCUMENT_ANALYSIS = "bytez_document_analysis"
+    PROJECT_COORDINATION = "project_coordination"
 
 
 class AgentState(str, Enum):
@@ -34,35 +101,145 @@ class AgentState(str, Enum):
     SHUTDOWN = "shutdown"
 
 
-class AgentMetadata(BaseModel):
+@dataclass(slots=True)
+class AgentMetadata:
     """Metadata for agents."""
-    agent_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     name: str
     description: str
-    version: str = "0.1.0"
     capabilities: List[AgentCapability]
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    agent_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    version: str = "0.1.0"
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Get a dataclass's field names, in declaration order."""
+    return tuple(f.name for f in fields(cls))
+
+
+def result_as_dict(result: Any) -> Any:
+    """Convert a dataclass task result to a dict for JSON callers.
+    
+    The conversion is shallow: unlike dataclasses.asdict(), nested read-only
+    mappings and tuples are shared rather than deep-copied. Results that are
+    not dataclass instances are returned unchanged.
+    
+    Args:
+        result: Value returned by an agent handler
+        
+    Returns:
+        A dict of the result's fields, or the result itself
+    """
+    if is_dataclass(result) and not isinstance(result, type):
+        return {name: getattr(result, name) for name in _field_names(type(result))}
+    return result
+
+
+def action(
+    name: str, serialized: bool = False
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Mark an agent method as the handler for an action.
+    
+    Args:
+        name: Action name, as given in a task's "action" field
+        serialized: Mark the method as the action's pre-serialized variant,
+            a plain function returning the JSON-encoded result as bytes
+    """
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        fn._action = sys.intern(name)
+        fn._serialized = serialized
+        return fn
+    return decorator
 
 
 class Agent(ABC):
     """Abstract base class for all agents in the system."""
 
-    def __init__(self, name: str, description: str, capabilities: List[AgentCapability]):
+    __slots__ = (
+        "metadata",
+        "state",
+        "error_log",
+        "_capability_values",
+        "_status_template",
+        "_init_msg",
+        "_shutdown_msg",
+    )
+
+    # Action name -> handler function, collected from @action methods
+    HANDLERS: Dict[str, Callable[..., Any]] = {}
+    # Actions whose handlers are plain functions rather than coroutines
+    _SYNC_ACTIONS: FrozenSet[str] = frozenset()
+    # Action name -> pre-serialized variant, from @action(..., serialized=True)
+    SERIALIZED_HANDLERS: Dict[str, Callable[..., bytes]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Build the subclass's action tables from its @action methods.
+        
+        Handlers inherited from parent classes are kept unless overridden,
+        either by a new @action method for the same action or by a plain
+        method of the same name as the inherited handler.
+        """
+        super().__init_subclass__(**kwargs)
+        namespace = cls.__dict__
+        handlers = {}
+        serialized = {}
+        for table, inherited in ((handlers, cls.HANDLERS), (serialized, cls.SERIALIZED_HANDLERS)):
+            for name, fn in inherited.items():
+                override = namespace.get(fn.__name__)
+                table[name] = override if callable(override) else fn
+        for fn in namespace.values():
+            name = getattr(fn, "_action", None)
+            if name is None:
+                continue
+            if getattr(fn, "_serialized", False):
+                serialized[name] = fn
+            else:
+                handlers[name] = fn
+        cls.HANDLERS = handlers
+        cls.SERIALIZED_HANDLERS = serialized
+        cls._SYNC_ACTIONS = frozenset(
+            name for name, fn in handlers.items()
+            if not inspect.iscoroutinefunction(fn)
+        )
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        capabilities: Optional[List[AgentCapability]] = None,
+        agent_id: Optional[str] = None,
+    ):
         """Initialize an agent.
         
         Args:
             name: Agent name
             description: Agent description
             capabilities: List of agent capabilities
+            agent_id: Fixed agent ID; a random UUID is generated if omitted
         """
+        capabilities = capabilities if capabilities is not None else []
         self.metadata = AgentMetadata(
             name=name,
             description=description,
-            capabilities=capabilities
+            capabilities=capabilities,
+            agent_id=agent_id if agent_id is not None else str(uuid.uuid4())
         )
+        self._capability_values: Tuple[str, ...] = tuple(cap.value for cap in capabilities)
+        # Status fields that never change after construction
+        self._status_template: Dict[str, Any] = {
+            "agent_id": self.metadata.agent_id,
+            "name": self.metadata.name,
+            "capabilities": self._capability_values,
+            # Left as a datetime; the orjson response layer encodes it natively
+            "created_at": self.metadata.created_at,
+        }
+        # Lifecycle log lines, formatted once rather than on every call
+        self._init_msg = f"{name} initialized"
+        self._shutdown_msg = f"{name} shutting down"
         self.state = AgentState.IDLE
-        self.error_log: List[Dict[str, Any]] = []
+        self.error_log: Deque[Dict[str, Any]] = deque(maxlen=ERROR_LOG_MAX)
 
     @property
     def agent_id(self) -> str:
@@ -79,29 +256,143 @@ class Agent(ABC):
         """Get agent capabilities."""
         return self.metadata.capabilities
 
-    @abstractmethod
-    async def execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
+    @property
+    def capability_values(self) -> Tuple[str, ...]:
+        """Get agent capability values, computed once at construction."""
+        return self._capability_values
+
+    async def execute(self, task: Dict[str, Any]) -> Any:
         """Execute a task.
         
+        The task's action selects a handler from HANDLERS, which is called
+        with the task's data. Synchronous handlers go through execute_sync();
+        only coroutine handlers are awaited.
+        
         Args:
             task: Task dictionary containing task parameters
             
         Returns:
-            Result dictionary
+            The handler's result: a mapping or a frozen result dataclass
+            (result_as_dict() turns either into a dict)
         """
-        pass
+        action = task.get("action", "")
+        # Table lookup rather than a per-agent match statement: on 3.11 a
+        # four-case match over JSON-decoded action strings measured only a
+        # few nanoseconds faster, and a hand-written match per agent would
+        # have to be kept in step with HANDLERS, which execute_many() and
+        # execute_json() also read
+        if action in self._SYNC_ACTIONS or action not in self.HANDLERS:
+            return self.execute_sync(task)
+        return await self.HANDLERS[action](self, task.get("data", {}))
+
+    def execute_sync(self, task: Dict[str, Any]) -> Any:
+        """Execute a task without an event loop.
+        
+        Only actions with synchronous handlers can run here. A handler that
+        needs to await I/O is written as a coroutine and reached through
+        execute() instead.
+        
+        Args:
+            task: Task dictionary containing task parameters
+            
+        Returns:
+            The handler's result, as for execute(); unknown actions get a
+            shared read-only {"error": "unknown_action"} mapping
+            
+        Raises:
+            TypeError: If the action's handler is a coroutine function
+        """
+        action = task.get("action", "")
+        if action in self._SYNC_ACTIONS:
+            return self.HANDLERS[action](self, task.get("data", {}))
+        if action in self.HANDLERS:
+            raise TypeError(f"Action '{action}' is asynchronous; use execute()")
+        logger.warning("Unknown action %s on %s", action, self.metadata.name)
+        return _UNKNOWN_ACTION
+
+    def execute_json(self, task: Dict[str, Any]) -> Optional[bytes]:
+        """Execute a task through its pre-serialized variant, if it has one.
+        
+        Args:
+            task: Task dictionary containing task parameters
+            
+        Returns:
+            The JSON-encoded result, or None if the action has no
+            pre-serialized variant and must go through execute()
+        """
+        handler = self.SERIALIZED_HANDLERS.get(task.get("action", ""))
+        if handler is None:
+            return None
+        return handler(self, task.get("data", {}))
+
+    async def execute_many(self, tasks: List[Dict[str, Any]]) -> List[Any]:
+        """Execute a batch of tasks.
+        
+        Tasks are grouped by action so each handler is resolved once per
+        group; groups run concurrently.
+        
+        Args:
+            tasks: Task dictionaries, as accepted by execute()
+            
+        Returns:
+            Results, as for execute(), in the same order as tasks; a task
+            that raised is reported as {"success": False, "error": ...}
+        """
+        groups: Dict[str, List[Tuple[int, Dict[str, Any]]]] = defaultdict(list)
+        for index, task in enumerate(tasks):
+            groups[task.get("action", "")].append((index, task))
+        
+        results: List[Any] = [None] * len(tasks)
+        # Handler table keys are interned source literals. Interning each
+        # group's action once lets its lookup match by identity; doing it
+        # per task in execute() would cost more than the lookup it saves.
+        await asyncio.gather(*(
+            self._execute_group(
+                sys.intern(action) if type(action) is str else action, items, results
+            )
+            for action, items in groups.items()
+        ))
+        return results
+
+    async def _execute_group(
+        self,
+        action: str,
+        items: List[Tuple[int, Dict[str, Any]]],
+        results: List[Any],
+    ) -> None:
+        """Run one action's tasks from execute_many, storing results by index.
+        
+        A task that raises gets an error entry; the rest of the batch runs on.
+        """
+        handler = self.HANDLERS.get(action)
+        is_sync = action in self._SYNC_ACTIONS
+        for index, task in items:
+            try:
+                if handler is None:
+                    # Unknown action, or an agent that overrides execute()
+                    result = await self.execute(task)
+                elif is_sync:
+                    result = handler(self, task.get("data", {}))
+                else:
+                    result = await handler(self, task.get("data", {}))
+            except Exception as e:
+                logger.error("Task %s failed on %s: %s", action, self.metadata.name, e)
+                result = {"success": False, "error": str(e)}
+            results[index] = result
 
-    @abstractmethod
     async def validate_input(self, input_data: Dict[str, Any]) -> bool:
         """Validate input data.
         
+        The default accepts any dictionary; agents with stricter
+        requirements override this.
+        
         Args:
             input_data: Input data to validate
             
         Returns:
             True if valid, False otherwise
         """
-        pass
+        return isinstance(input_data, dict)
 
     async def initialize(self) -> None:
         """Initialize the agent."""
@@ -114,12 +405,14 @@ class Agent(ABC):
     def log_error(self, error: str, context: Optional[Dict[str, Any]] = None) -> None:
         """Log an error.
         
+        Only the most recent AGENT_ERROR_LOG_MAX errors are retained.
+        
         Args:
             error: Error message
             context: Additional context
         """
         self.error_log.append({
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),
             "error": error,
             "context": context or {}
         })
@@ -127,10 +420,7 @@ class Agent(ABC):
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status."""
         return {
-            "agent_id": self.agent_id,
-            "name": self.name,
+            **self._status_template,
             "state": self.state.value,
-            "capabilities": [cap.value for cap in self.capabilities],
             "error_count": len(self.error_log),
-            "created_at": self.metadata.created_at.isoformat(),
         }
@@ -3,9 +3,11 @@
 Manages registration, discovery, and lifecycle of agents in the system.
 """
 
-from typing import Dict, List, Optional, Type
+import hashlib
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from .agent_base import Agent, AgentCapability
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -16,9 +18,14 @@ class AgentRegistry:
     def __init__(self):
         """Initialize the registry."""
         self._agents: Dict[str, Agent] = {}
-        self._agents_by_capability: Dict[AgentCapability, List[str]] = {}
-        for cap in AgentCapability:
-            self._agents_by_capability[cap] = []
+        self._agents_by_capability: Dict[AgentCapability, Set[str]] = {
+            cap: set() for cap in AgentCapability
+        }
+        self._agents_by_name_lower: Dict[str, Agent] = {}
+        self._agents_tuple: Optional[Tuple[Agent, ...]] = None
+        self._cached_agents_payload: Optional[bytes] = None
+        self._cached_agents_etag: Optional[str] = None
+        self._static_status_cache: Optional[Dict] = None
 
     def register(self, agent: Agent) -> None:
         """Register an agent.
@@ -27,14 +34,23 @@ class AgentRegistry:
             agent: Agent instance to register
         """
         agent_id = agent.agent_id
-        if agent_id in self._agents:
+        previous = self._agents.get(agent_id)
+        if previous is not None:
             logger.warning(f"Agent {agent_id} already registered, overwriting")
+            # Drop the replaced agent's name and capability entries
+            if self._agents_by_name_lower.get(previous.name.lower()) is previous:
+                del self._agents_by_name_lower[previous.name.lower()]
+            for capability in previous.capabilities:
+                self._agents_by_capability[capability].discard(agent_id)
         
         self._agents[agent_id] = agent
+        self._agents_by_name_lower[agent.name.lower()] = agent
+        self._agents_tuple = None
+        self._cached_agents_payload = None
+        self._static_status_cache = None
         
         for capability in agent.capabilities:
-            if agent_id not in self._agents_by_capability[capability]:
-                self._agents_by_capability[capability].append(agent_id)
+            self._agents_by_capability[capability].add(agent_id)
         
         logger.info(f"Registered agent {agent.name} ({agent_id})")
 
@@ -51,10 +67,14 @@ class AgentRegistry:
             return False
         
         agent = self._agents.pop(agent_id)
+        if self._agents_by_name_lower.get(agent.name.lower()) is agent:
+            del self._agents_by_name_lower[agent.name.lower()]
+        self._agents_tuple = None
+        self._cached_agents_payload = None
+        self._static_status_cache = None
         
         for capability in agent.capabilities:
-            if agent_id in self._agents_by_capability[capability]:
-                self._agents_by_capability[capability].remove(agent_id)
+            self._agents_by_capability[capability].discard(agent_id)
         
         logger.info(f"Unregistered agent {agent.name} ({agent_id})")
         return True
@@ -70,6 +90,17 @@ class AgentRegistry:
         """
         return self._agents.get(agent_id)
 
+    def get_agent_by_name(self, name: str) -> Optional[Agent]:
+        """Get an agent by name (case-insensitive).
+        
+        Args:
+            name: Name of agent
+            
+        Returns:
+            Agent instance or None if not found
+        """
+        return self._agents_by_name_lower.get(name.lower())
+
     def get_agents_by_capability(self, capability: AgentCapability) -> List[Agent]:
         """Get agents with a specific capability.
         
@@ -79,30 +110,106 @@ class AgentRegistry:
         Returns:
             List of agents with the capability
         """
-        agent_ids = self._agents_by_capability.get(capability, [])
+        agent_ids = self._agents_by_capability.get(capability, ())
         return [self._agents[aid] for aid in agent_ids if aid in self._agents]
 
-    def list_all_agents(self) -> List[Agent]:
+    def list_all_agents(self) -> Tuple[Agent, ...]:
         """List all registered agents.
         
+        The tuple is cached until the next register/unregister call.
+        
+        Returns:
+            Tuple of all agents
+        """
+        if self._agents_tuple is None:
+            self._agents_tuple = tuple(self._agents.values())
+        return self._agents_tuple
+
+    def iter_agents(self) -> Iterable[Agent]:
+        """Iterate over registered agents without copying.
+        
+        Returns:
+            Live view of the registered agents
+        """
+        return self._agents.values()
+
+    def get_agents_list_json(self) -> bytes:
+        """Get the serialized agent listing.
+        
+        The payload is built on first use and cached until the next
+        register/unregister call.
+        
+        Returns:
+            JSON document with the agent count and each agent's id, name
+            and capabilities
+        """
+        if self._cached_agents_payload is None:
+            payload = orjson.dumps({
+                "total_agents": len(self._agents),
+                "agents": [
+                    {
+                        "id": agent.agent_id,
+                        "name": agent.name,
+                        "capabilities": agent.capability_values
+                    }
+                    for agent in self._agents.values()
+                ]
+            })
+            self._cached_agents_etag = f'"{hashlib.md5(payload).hexdigest()}"'
+            self._cached_agents_payload = payload
+        return self._cached_agents_payload
+
+    def get_agents_list_etag(self) -> str:
+        """Get the HTTP entity tag of the cached agent listing.
+        
         Returns:
-            List of all agents
+            Quoted hash of the payload returned by get_agents_list_json()
         """
-        return list(self._agents.values())
+        if self._cached_agents_payload is None:
+            self.get_agents_list_json()
+        return self._cached_agents_etag
 
     def get_registry_status(self) -> Dict:
         """Get registry status.
         
+        The counts only change on register/unregister and are cached
+        between mutations; only per-agent state is read on every call.
+        
         Returns:
             Dictionary with registry statistics
         """
         return {
-            "total_agents": len(self._agents),
-            "agents_by_capability": {
-                cap.value: len(agent_ids)
-                for cap, agent_ids in self._agents_by_capability.items()
-            },
+            **self._get_static_status(),
             "agent_details": [
                 agent.get_status() for agent in self._agents.values()
             ]
         }
+
+    def iter_registry_status_json(self) -> Iterator[bytes]:
+        """Serialize the registry status incrementally.
+        
+        Yields the same document as get_registry_status() in chunks, one
+        per agent, so the full status never has to be materialized at once.
+        
+        Yields:
+            Consecutive fragments of the JSON document
+        """
+        # Reopen the serialized static part to append the agent details
+        yield orjson.dumps(self._get_static_status())[:-1] + b',"agent_details":['
+        separator = b""
+        for agent in self.list_all_agents():
+            yield separator + orjson.dumps(agent.get_status())
+            separator = b","
+        yield b"]}"
+
+    def _get_static_status(self) -> Dict:
+        """Get the status fields that only change on register/unregister."""
+        if self._static_status_cache is None:
+            self._static_status_cache = {
+                "total_agents": len(self._agents),
+                "agents_by_capability": {
+                    cap.value: len(agent_ids)
+                    for cap, agent_ids in self._agents_by_capability.items()
+                },
+            }
+        return self._static_status_cache
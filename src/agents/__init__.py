@@ -1,28 +1,48 @@
 """Agents Module
 
 Contains all specialized AI agents for the Supervisor orchestration system.
+
+Agent classes are imported lazily on first attribute access (PEP 562), so a
+process only pays the import cost of the agents it actually uses.
+
+Agent modules share a few conventions for their per-call hot paths:
+
+- Static response content is built once at import and shared by every call.
+  Mappings are MappingProxyType views, so responses embed them without copying.
+- Handlers read their fields through module-level operator.itemgetter
+  extractors (_GET_<ACTION>) and fall back to .get() defaults when a key is
+  missing.
+- Modules that log on every call bind logger.info once as _log_info.
 """
 
-from .investment_agent import InvestmentManagementAgent
-from .dealer_agent import DealerOnboardingAgent
-from .bursary_agent import BursaryManagementAgent
-from .consulting_agent import ConsultingProposalAgent
-from .government_agent import GovernmentContractingAgent
-from .operations_agent import OperationsAgent
-from .rd_agent import ResearchDevelopmentAgent
-from .pricing_agent import PricingSpecialistAgent
-from .cfo_agent import CFOAgent
-from .marketing_agent import MarketingSpecialistAgent
-
-__all__ = [
-    'InvestmentManagementAgent',
-    'DealerOnboardingAgent',
-    'BursaryManagementAgent',
-    'ConsultingProposalAgent',
-    'GovernmentContractingAgent',
-    'OperationsAgent',
-    'ResearchDevelopmentAgent',
-    'PricingSpecialistAgent',
-    'CFOAgent',
-    'MarketingSpecialistAgent',
-]
+import importlib
+from typing import Any
+
+_AGENT_MODULES = {
+    'InvestmentManagementAgent': '.investment_agent',
+    'DealerOnboardingAgent': '.dealer_agent',
+    'BursaryManagementAgent': '.bursary_agent',
+    'ConsultingProposalAgent': '.consulting_agent',
+    'GovernmentContractingAgent': '.government_agent',
+    'OperationsAgent': '.operations_agent',
+    'ResearchDevelopmentAgent': '.rd_agent',
+    'PricingSpecialistAgent': '.pricing_agent',
+    'CFOAgent': '.cfo_agent',
+    'MarketingSpecialistAgent': '.marketing_agent',
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _AGENT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,49 @@
+"""Shared Id Helpers
+
+Provides the sequential ids agents assign to the records they create.
+"""
+
+import itertools
+import os
+import time
+import weakref
+
+# Every sequence, so a forked child can restart them all
+_SEQUENCES = weakref.WeakSet()
+
+
+class IdSequence:
+    """Issues ids of the form <prefix>_<epoch>_<pid>_<sequence>.
+
+    The epoch and pid are read on first use in each process, so worker
+    processes forked from one parent, or started within the same second,
+    never issue the same id.
+    """
+
+    __slots__ = ("_prefix", "_stem", "_counter", "__weakref__")
+
+    def __init__(self, prefix: str):
+        self._prefix = prefix
+        self._stem = None
+        self._counter = None
+        _SEQUENCES.add(self)
+
+    def __call__(self) -> str:
+        """Get the next id."""
+        stem = self._stem
+        if stem is None:
+            self._counter = itertools.count(1)
+            stem = self._stem = f"{self._prefix}_{int(time.time())}_{os.getpid()}_"
+        return f"{stem}{next(self._counter)}"
+
+    def _reset(self) -> None:
+        self._stem = None
+
+
+def _reset_after_fork() -> None:
+    for sequence in _SEQUENCES:
+        sequence._reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,66 @@
+"""Shared Timestamp Helpers
+
+Provides the ISO timestamps stamped on agent responses. Formatting is
+cached per millisecond, so handlers completing within the same millisecond
+share a single string instead of each formatting their own.
+"""
+
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional, Tuple
+
+# Bound once; read on every timestamped response
+_time_ns = time.time_ns
+_fromtimestamp = datetime.fromtimestamp
+
+
+class _IsoClock:
+    """Wall clock whose ISO-8601 rendering is cached per millisecond."""
+
+    __slots__ = ("_cached",)
+
+    def __init__(self):
+        # (millisecond bucket, ISO string); kept as one tuple so concurrent
+        # readers never see a bucket paired with another bucket's string
+        self._cached = (-1, "")
+
+    def now_iso(self) -> str:
+        """Get the current local time as an ISO-8601 string (millisecond precision)."""
+        return self._format(_time_ns() // 1_000_000)
+
+    def now_fields(self) -> Tuple[int, str]:
+        """Get the current time as (nanoseconds since the epoch, ISO-8601 string).
+        
+        Both values come from a single clock read, so they always agree.
+        """
+        now_ns = _time_ns()
+        return now_ns, self._format(now_ns // 1_000_000)
+
+    def _format(self, bucket: int) -> str:
+        """Get the ISO-8601 string for a millisecond bucket, reusing the cached one."""
+        cached = self._cached
+        if cached[0] != bucket:
+            seconds, millis = divmod(bucket, 1000)
+            iso = _fromtimestamp(seconds).replace(microsecond=millis * 1000).isoformat(timespec="microseconds")
+            cached = self._cached = (bucket, iso)
+        return cached[1]
+
+
+_ISO = _IsoClock()
+now_iso = _ISO.now_iso
+now_fields = _ISO.now_fields
+
+
+# Timestamp shared by a batch in SupervisorOrchestrator.delegate_many(); kept
+# out of the task data so clients cannot supply it
+batch_timestamp: ContextVar[Optional[str]] = ContextVar("batch_timestamp", default=None)
+
+
+def task_timestamp() -> str:
+    """Get the timestamp for a handler's response.
+    
+    Inside a batch delegated through SupervisorOrchestrator.delegate_many()
+    this is the batch's shared timestamp; otherwise the current time is used.
+    """
+    return batch_timestamp.get() or now_iso()
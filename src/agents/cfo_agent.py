@@ -3,96 +3,110 @@
 Specialized agent for financial management with Dolibarr integration.
 """
 
-import asyncio, logging
+import logging
+from types import MappingProxyType
 from typing import Dict, Any
-from datetime import datetime
-from ..agent_management import Agent, AgentCapability
+from ..agent_management import Agent, AgentCapability, action
+from ._time import now_iso, task_timestamp
 
 logger = logging.getLogger(__name__)
 
 class CFOAgent(Agent):
     """Agent for financial management with Dolibarr ERP integration."""
 
+    __slots__ = ("runtime_state",)
+
+    _CAPABILITIES = (
+        AgentCapability.FINANCIAL_PLANNING,
+        AgentCapability.DOLIBARR_INTEGRATION,
+        AgentCapability.BUDGET_MANAGEMENT,
+        AgentCapability.FINANCIAL_REPORTING,
+    )
+
+    # Read-only response templates shared by every call; handlers splice in
+    # the request-specific fields
+    _FINANCES_TEMPLATE = MappingProxyType({
+        "cash_flow": 150000,
+        "liquid_assets": 500000,
+        "total_debt": 200000,
+        "net_position": 300000,
+        "dolibarr_sync_status": "synced",
+    })
+    _BUDGET_TEMPLATE = MappingProxyType({
+        "total_budget": 2000000,
+        "allocations": MappingProxyType({
+            "operations": 800000,
+            "marketing": 400000,
+            "r_and_d": 500000,
+            "reserves": 300000
+        }),
+        "budget_efficiency": 0.92,
+    })
+    _REPORT_TEMPLATE = MappingProxyType({
+        "financials": MappingProxyType({
+            "revenue": 5000000,
+            "expenses": 3500000,
+            "net_income": 1500000,
+            "roi": 0.42
+        }),
+        "dolibarr_source": "connected",
+    })
+    _SYNC_TEMPLATE = MappingProxyType({
+        "status": "synced",
+        "records_synced": 250,
+        "dolibarr_url": "https://dolibarr.luvium.online",
+    })
+
     def __init__(self, agent_id: str = "agent_cfo_001"):
         super().__init__(
             agent_id=agent_id,
             name="CFO Manager",
-            capabilities=[
-                AgentCapability("financial_planning"),
-                AgentCapability("dolibarr_integration"),
-                AgentCapability("budget_management"),
-                AgentCapability("financial_reporting")
-            ]
+            capabilities=list(self._CAPABILITIES)
         )
 
     async def initialize(self) -> None:
-        logger.info(f"{self.name} initialized")
-        self.state = {"dolibarr_connected": False, "initialized_at": datetime.now().isoformat()}
-
-    async def execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        action = task.get("action", "")
-        if action == "manage_finances":
-            return await self._manage_finances(task.get("data", {}))
-        elif action == "budget_planning":
-            return await self._budget_planning(task.get("data", {}))
-        elif action == "generate_report":
-            return await self._generate_report(task.get("data", {}))
-        elif action == "sync_dolibarr":
-            return await self._sync_dolibarr(task.get("data", {}))
-        else:
-            return {"error": f"Unknown action: {action}"}
+        await super().initialize()
+        logger.info(self._init_msg)
+        self.runtime_state = {"dolibarr_connected": False, "initialized_at": now_iso()}
 
-    async def _manage_finances(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @action("manage_finances")
+    def _manage_finances(self, data: Dict[str, Any]) -> Dict[str, Any]:
         account_id = data.get("account_id")
         return {
             "account_id": account_id,
-            "cash_flow": 150000,
-            "liquid_assets": 500000,
-            "total_debt": 200000,
-            "net_position": 300000,
-            "dolibarr_sync_status": "synced",
-            "timestamp": datetime.now().isoformat()
+            **self._FINANCES_TEMPLATE,
+            "timestamp": task_timestamp()
         }
 
-    async def _budget_planning(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @action("budget_planning")
+    def _budget_planning(self, data: Dict[str, Any]) -> Dict[str, Any]:
         fiscal_year = data.get("fiscal_year")
         return {
             "fiscal_year": fiscal_year,
-            "total_budget": 2000000,
-            "allocations": {
-                "operations": 800000,
-                "marketing": 400000,
-                "r_and_d": 500000,
-                "reserves": 300000
-            },
-            "budget_efficiency": 0.92,
-            "timestamp": datetime.now().isoformat()
+            **self._BUDGET_TEMPLATE,
+            "timestamp": task_timestamp()
         }
 
-    async def _generate_report(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @action("generate_report")
+    def _generate_report(self, data: Dict[str, Any]) -> Dict[str, Any]:
         report_type = data.get("report_type", "quarterly")
         return {
             "report_type": report_type,
-            "financials": {
-                "revenue": 5000000,
-                "expenses": 3500000,
-                "net_income": 1500000,
-                "roi": 0.42
-            },
-            "dolibarr_source": "connected",
-            "timestamp": datetime.now().isoformat()
+            **self._REPORT_TEMPLATE,
+            "timestamp": task_timestamp()
         }
 
-    async def _sync_dolibarr(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @action("sync_dolibarr")
+    def _sync_dolibarr(self, data: Dict[str, Any]) -> Dict[str, Any]:
         sync_type = data.get("sync_type")
+        timestamp = task_timestamp()
         return {
             "sync_type": sync_type,
-            "status": "synced",
-            "records_synced": 250,
-            "dolibarr_url": "https://dolibarr.luvium.online",
-            "last_sync": datetime.now().isoformat(),
-            "timestamp": datetime.now().isoformat()
+            **self._SYNC_TEMPLATE,
+            "last_sync": timestamp,
+            "timestamp": timestamp
         }
 
     async def shutdown(self) -> None:
-        logger.info(f"{self.name} shutting down")
+        logger.info(self._shutdown_msg)
+        await super().shutdown()
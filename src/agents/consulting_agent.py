@@ -3,18 +3,74 @@
 Specialized agent for generating consulting proposals and managing consulting engagements.
 """
 
-import asyncio
 import logging
-from typing import Dict, List, Any, Optional
-from datetime import datetime
-from ..agent_management import Agent, AgentCapability
+from functools import lru_cache
+from typing import Dict, Any
+from operator import itemgetter
+from types import MappingProxyType
+from ..agent_management import Agent, AgentCapability, action
+from ._ids import IdSequence
+from ._time import now_iso, task_timestamp
 
 logger = logging.getLogger(__name__)
+_log_info = logger.info
+
+_PROPOSAL_SECTIONS = (
+    "executive_summary",
+    "objectives",
+    "methodology",
+    "timeline",
+    "budget",
+    "team",
+    "success_metrics"
+)
+_SCOPE_EXCLUSIONS = ("maintenance", "support beyond scope")
+_SCOPE_ASSUMPTIONS = (
+    "client participation",
+    "data availability",
+    "approvals timeline"
+)
+_PHASES = (
+    MappingProxyType({"phase": "Discovery", "weeks": 2}),
+    MappingProxyType({"phase": "Design", "weeks": 4}),
+    MappingProxyType({"phase": "Implementation", "weeks": 4}),
+    MappingProxyType({"phase": "Testing & Review", "weeks": 2})
+)
+# Base cost per team member by project complexity
+_BUDGET_MULTIPLIERS = MappingProxyType({
+    "low": 50000,
+    "medium": 100000,
+    "high": 200000
+})
+
+
+@lru_cache(maxsize=256, typed=True)
+def _budget_for(complexity: str, team_size: int) -> tuple:
+    """Get (base cost, total budget) for a project, memoized per input."""
+    base_cost = _BUDGET_MULTIPLIERS.get(complexity, 100000)
+    return base_cost, base_cost * team_size
+
+
+_GET_GENERATE_PROPOSAL = itemgetter("client_name", "project_type")
+_GET_DEFINE_SCOPE = itemgetter("project_name", "deliverables")
+_GET_PLAN_TIMELINE = itemgetter("project_id", "duration_weeks")
+_GET_ESTIMATE_BUDGET = itemgetter("complexity", "team_size")
 
 
 class ConsultingProposalAgent(Agent):
     """Agent for generating and managing consulting proposals."""
 
+    __slots__ = ("runtime_state",)
+
+    _proposal_ids = IdSequence("PROP")
+
+    _CAPABILITIES = (
+        AgentCapability.PROPOSAL_GENERATION,
+        AgentCapability.SCOPE_DEFINITION,
+        AgentCapability.TIMELINE_PLANNING,
+        AgentCapability.BUDGET_ESTIMATION,
+    )
+
     def __init__(self, agent_id: str = "agent_consulting_001"):
         """Initialize the Consulting Proposal Agent.
         
@@ -24,123 +80,89 @@ class ConsultingProposalAgent(Agent):
         super().__init__(
             agent_id=agent_id,
             name="Consulting Specialist",
-            capabilities=[
-                AgentCapability("proposal_generation"),
-                AgentCapability("scope_definition"),
-                AgentCapability("timeline_planning"),
-                AgentCapability("budget_estimation")
-            ]
+            capabilities=list(self._CAPABILITIES)
         )
 
     async def initialize(self) -> None:
         """Initialize the agent."""
-        logger.info(f"{self.name} initialized")
-        self.state = {
+        await super().initialize()
+        _log_info(self._init_msg)
+        self.runtime_state = {
             "active_proposals": 0,
             "completed_engagements": 0,
-            "initialized_at": datetime.now().isoformat()
+            "initialized_at": now_iso()
         }
 
-    async def execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a consulting task.
-        
-        Args:
-            task: Task dictionary containing action and parameters
-            
-        Returns:
-            Result of the consulting task
-        """
-        action = task.get("action", "")
-        
-        if action == "generate_proposal":
-            return await self._generate_proposal(task.get("data", {}))
-        elif action == "define_scope":
-            return await self._define_scope(task.get("data", {}))
-        elif action == "plan_timeline":
-            return await self._plan_timeline(task.get("data", {}))
-        elif action == "estimate_budget":
-            return await self._estimate_budget(task.get("data", {}))
-        else:
-            return {"error": f"Unknown action: {action}"}
-
-    async def _generate_proposal(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @action("generate_proposal")
+    def _generate_proposal(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate consulting proposal."""
-        client_name = data.get("client_name")
-        project_type = data.get("project_type")
+        try:
+            client_name, project_type = _GET_GENERATE_PROPOSAL(data)
+        except KeyError:
+            client_name = data.get("client_name")
+            project_type = data.get("project_type")
         
         proposal = {
-            "proposal_id": f"PROP_{datetime.now().timestamp()}",
+            "proposal_id": self._proposal_ids(),
             "client_name": client_name,
             "project_type": project_type,
             "status": "draft",
-            "sections": [
-                "executive_summary",
-                "objectives",
-                "methodology",
-                "timeline",
-                "budget",
-                "team",
-                "success_metrics"
-            ],
-            "generation_timestamp": datetime.now().isoformat()
+            "sections": _PROPOSAL_SECTIONS,
+            "generation_timestamp": task_timestamp()
         }
         
-        logger.info(f"Proposal generated for client {client_name}")
+        _log_info("Proposal generated for client %s", client_name)
         return proposal
 
-    async def _define_scope(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @action("define_scope")
+    def _define_scope(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Define project scope."""
-        project_name = data.get("project_name")
-        deliverables = data.get("deliverables", [])
+        try:
+            project_name, deliverables = _GET_DEFINE_SCOPE(data)
+        except KeyError:
+            project_name = data.get("project_name")
+            deliverables = data.get("deliverables", [])
         
         scope = {
             "project_name": project_name,
             "deliverables": deliverables,
-            "exclusions": ["maintenance", "support beyond scope"],
-            "assumptions": [
-                "client participation",
-                "data availability",
-                "approvals timeline"
-            ],
-            "scope_definition_timestamp": datetime.now().isoformat()
+            "exclusions": _SCOPE_EXCLUSIONS,
+            "assumptions": _SCOPE_ASSUMPTIONS,
+            "scope_definition_timestamp": task_timestamp()
         }
         
-        logger.info(f"Scope defined for project {project_name}")
+        _log_info("Scope defined for project %s", project_name)
         return scope
 
-    async def _plan_timeline(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @action("plan_timeline")
+    def _plan_timeline(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Plan project timeline."""
-        project_id = data.get("project_id")
-        duration_weeks = data.get("duration_weeks", 12)
+        try:
+            project_id, duration_weeks = _GET_PLAN_TIMELINE(data)
+        except KeyError:
+            project_id = data.get("project_id")
+            duration_weeks = data.get("duration_weeks", 12)
         
         timeline = {
             "project_id": project_id,
             "duration_weeks": duration_weeks,
-            "phases": [
-                {"phase": "Discovery", "weeks": 2},
-                {"phase": "Design", "weeks": 4},
-                {"phase": "Implementation", "weeks": 4},
-                {"phase": "Testing & Review", "weeks": 2}
-            ],
-            "timeline_timestamp": datetime.now().isoformat()
+            "phases": _PHASES,
+            "timeline_timestamp": task_timestamp()
         }
         
-        logger.info(f"Timeline planned for project {project_id}")
+        _log_info("Timeline planned for project %s", project_id)
         return timeline
 
-    async def _estimate_budget(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @action("estimate_budget")
+    def _estimate_budget(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Estimate project budget."""
-        project_complexity = data.get("complexity", "medium")
-        team_size = data.get("team_size", 3)
-        
-        budget_multipliers = {
-            "low": 50000,
-            "medium": 100000,
-            "high": 200000
-        }
+        try:
+            project_complexity, team_size = _GET_ESTIMATE_BUDGET(data)
+        except KeyError:
+            project_complexity = data.get("complexity", "medium")
+            team_size = data.get("team_size", 3)
         
-        base_cost = budget_multipliers.get(project_complexity, 100000)
-        total_budget = base_cost * team_size
+        base_cost, total_budget = _budget_for(project_complexity, team_size)
         
         budget = {
             "complexity": project_complexity,
@@ -148,12 +170,13 @@ class ConsultingProposalAgent(Agent):
             "base_cost": base_cost,
             "total_budget": total_budget,
             "currency": "USD",
-            "budget_estimation_timestamp": datetime.now().isoformat()
+            "budget_estimation_timestamp": task_timestamp()
         }
         
-        logger.info(f"Budget estimated: ${total_budget}")
+        _log_info("Budget estimated: $%s", total_budget)
         return budget
 
     async def shutdown(self) -> None:
         """Shutdown the agent."""
-        logger.info(f"{self.name} shutting down")
+        _log_info(self._shutdown_msg)
+        await super().shutdown()
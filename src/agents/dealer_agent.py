@@ -3,18 +3,44 @@
 Specialized agent for managing dealer registration, verification, and onboarding processes.
 """
 
-import asyncio
 import logging
-from typing import Dict, List, Any, Optional
-from datetime import datetime
-from ..agent_management import Agent, AgentCapability
+from typing import Dict, Any
+from operator import itemgetter
+from types import MappingProxyType
+from ..agent_management import Agent, AgentCapability, action
+from ._ids import IdSequence
+from ._time import now_iso, task_timestamp
 
 logger = logging.getLogger(__name__)
+_log_info = logger.info
+
+_DOCUMENTS_CHECKED = ("passport", "business_license")
+_COMPLIANCE_CHECKS = MappingProxyType({
+    "kyc": "passed",
+    "aml": "passed",
+    "sanctions_screening": "passed",
+    "business_registration": "passed"
+})
+
+_GET_REGISTER_DEALER = itemgetter("dealer_name", "contact_email", "business_type")
+_GET_VERIFY_IDENTITY = itemgetter("dealer_id", "identity_document")
+_GET_SETUP_ACCOUNT = itemgetter("dealer_id", "account_type")
 
 
 class DealerOnboardingAgent(Agent):
     """Agent for dealer onboarding and account management."""
 
+    __slots__ = ("runtime_state",)
+
+    _dealer_ids = IdSequence("DEALER")
+
+    _CAPABILITIES = (
+        AgentCapability.DEALER_REGISTRATION,
+        AgentCapability.IDENTITY_VERIFICATION,
+        AgentCapability.COMPLIANCE_CHECK,
+        AgentCapability.ACCOUNT_SETUP,
+    )
+
     def __init__(self, agent_id: str = "agent_dealer_001"):
         """Initialize the Dealer Onboarding Agent.
         
@@ -24,102 +50,88 @@ class DealerOnboardingAgent(Agent):
         super().__init__(
             agent_id=agent_id,
             name="Dealer Onboarding Specialist",
-            capabilities=[
-                AgentCapability("dealer_registration"),
-                AgentCapability("identity_verification"),
-                AgentCapability("compliance_check"),
-                AgentCapability("account_setup")
-            ]
+            capabilities=list(self._CAPABILITIES)
         )
 
     async def initialize(self) -> None:
         """Initialize the agent."""
-        logger.info(f"{self.name} initialized")
-        self.state = {
+        await super().initialize()
+        _log_info(self._init_msg)
+        self.runtime_state = {
             "onboarded_dealers": 0,
             "pending_verifications": [],
-            "initialized_at": datetime.now().isoformat()
+            "initialized_at": now_iso()
         }
 
-    async def execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a dealer onboarding task.
-        
-        Args:
-            task: Task dictionary containing action and parameters
-            
-        Returns:
-            Result of the dealer onboarding task
-        """
-        action = task.get("action", "")
-        
-        if action == "register_dealer":
-            return await self._register_dealer(task.get("data", {}))
-        elif action == "verify_identity":
-            return await self._verify_identity(task.get("data", {}))
-        elif action == "check_compliance":
-            return await self._check_compliance(task.get("data", {}))
-        elif action == "setup_account":
-            return await self._setup_account(task.get("data", {}))
-        else:
-            return {"error": f"Unknown action: {action}"}
-
-    async def _register_dealer(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @action("register_dealer")
+    def _register_dealer(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Register a new dealer."""
-        dealer_name = data.get("dealer_name")
-        contact_email = data.get("contact_email")
-        business_type = data.get("business_type")
+        try:
+            dealer_name, contact_email, business_type = _GET_REGISTER_DEALER(data)
+        except KeyError:
+            dealer_name = data.get("dealer_name")
+            contact_email = data.get("contact_email")
+            business_type = data.get("business_type")
         
         registration = {
-            "dealer_id": f"DEALER_{datetime.now().timestamp()}",
+            "dealer_id": self._dealer_ids(),
             "dealer_name": dealer_name,
             "contact_email": contact_email,
             "business_type": business_type,
             "status": "registered",
-            "registration_timestamp": datetime.now().isoformat()
+            "registration_timestamp": task_timestamp()
         }
         
-        logger.info(f"Dealer {dealer_name} registered")
+        _log_info("Dealer %s registered", dealer_name)
         return registration
 
-    async def _verify_identity(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @action("verify_identity")
+    def _verify_identity(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Verify dealer identity."""
-        dealer_id = data.get("dealer_id")
-        identity_document = data.get("identity_document")
+        try:
+            dealer_id, identity_document = _GET_VERIFY_IDENTITY(data)
+        except KeyError:
+            dealer_id = data.get("dealer_id")
+            identity_document = data.get("identity_document")
         
         verification_result = {
             "dealer_id": dealer_id,
             "verification_status": "verified",
             "verification_score": 0.98,
-            "documents_checked": ["passport", "business_license"],
-            "verification_timestamp": datetime.now().isoformat()
+            "documents_checked": _DOCUMENTS_CHECKED,
+            "verification_timestamp": task_timestamp()
         }
         
-        logger.info(f"Identity verification completed for dealer {dealer_id}")
+        _log_info("Identity verification completed for dealer %s", dealer_id)
         return verification_result
 
-    async def _check_compliance(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Check compliance status."""
+    @action("check_compliance")
+    def _check_compliance(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Check compliance status.
+        
+        The returned "checks" mapping is shared and read-only.
+        """
         dealer_id = data.get("dealer_id")
         
         compliance_check = {
             "dealer_id": dealer_id,
             "compliance_status": "compliant",
-            "checks": {
-                "kyc": "passed",
-                "aml": "passed",
-                "sanctions_screening": "passed",
-                "business_registration": "passed"
-            },
-            "compliance_timestamp": datetime.now().isoformat()
+            "checks": _COMPLIANCE_CHECKS,
+            "compliance_timestamp": task_timestamp()
         }
         
-        logger.info(f"Compliance check completed for dealer {dealer_id}")
+        if logger.isEnabledFor(logging.INFO):
+            _log_info("Compliance check completed for dealer %s", dealer_id)
         return compliance_check
 
-    async def _setup_account(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @action("setup_account")
+    def _setup_account(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Setup dealer account."""
-        dealer_id = data.get("dealer_id")
-        account_type = data.get("account_type", "standard")
+        try:
+            dealer_id, account_type = _GET_SETUP_ACCOUNT(data)
+        except KeyError:
+            dealer_id = data.get("dealer_id")
+            account_type = data.get("account_type", "standard")
         
         account_setup = {
             "dealer_id": dealer_id,
@@ -127,12 +139,13 @@ class DealerOnboardingAgent(Agent):
             "account_type": account_type,
             "status": "active",
             "api_key_generated": True,
-            "setup_timestamp": datetime.now().isoformat()
+            "setup_timestamp": task_timestamp()
         }
         
-        logger.info(f"Account setup completed for dealer {dealer_id}")
+        _log_info("Account setup completed for dealer %s", dealer_id)
         return account_setup
 
     async def shutdown(self) -> None:
         """Shutdown the agent."""
-        logger.info(f"{self.name} shutting down")
+        _log_info(self._shutdown_msg)
+        await super().shutdown()
@@ -3,18 +3,58 @@
 Specialized agent for investment portfolio management, analysis, and advisory.
 """
 
-import asyncio
 import logging
-from typing import Dict, List, Any, Optional
-from datetime import datetime
-from ..agent_management import Agent, AgentCapability
+from functools import lru_cache
+from typing import Dict, Any
+from operator import itemgetter
+from types import MappingProxyType
+from ..agent_management import Agent, AgentCapability, action
+from ._time import now_iso, task_timestamp
 
 logger = logging.getLogger(__name__)
+_log_info = logger.info
+
+_PERFORMANCE_METRICS = MappingProxyType({
+    "ytd_return": 12.5,
+    "1_year_return": 8.3,
+    "3_year_return": 7.1
+})
+# Asset allocation ratios by risk profile
+_ALLOCATIONS = MappingProxyType({
+    "conservative": MappingProxyType({"stocks": 0.30, "bonds": 0.60, "cash": 0.10}),
+    "moderate": MappingProxyType({"stocks": 0.60, "bonds": 0.30, "cash": 0.10}),
+    "aggressive": MappingProxyType({"stocks": 0.80, "bonds": 0.15, "cash": 0.05})
+})
+_RECOMMENDATIONS = (
+    MappingProxyType({"action": "rebalance", "priority": "high", "reason": "Portfolio drift detected"}),
+    MappingProxyType({"action": "increase_exposure", "priority": "medium", "reason": "Bullish market signals"}),
+    MappingProxyType({"action": "hedge_position", "priority": "low", "reason": "Risk mitigation"})
+)
+
+
+@lru_cache(maxsize=256, typed=True)
+def _allocation_for(risk_profile: str, amount: float) -> tuple:
+    """Get (asset class, amount) pairs for an investment, memoized per input."""
+    ratios = _ALLOCATIONS.get(risk_profile, _ALLOCATIONS["moderate"])
+    return tuple((k, amount * v) for k, v in ratios.items())
+
+
+_GET_ANALYZE_PORTFOLIO = itemgetter("portfolio_id", "holdings")
+_GET_ALLOCATE_ASSETS = itemgetter("investment_amount", "risk_profile")
 
 
 class InvestmentManagementAgent(Agent):
     """Agent for managing investment portfolios and providing investment advice."""
 
+    __slots__ = ("runtime_state",)
+
+    _CAPABILITIES = (
+        AgentCapability.PORTFOLIO_MANAGEMENT,
+        AgentCapability.INVESTMENT_ANALYSIS,
+        AgentCapability.ASSET_ALLOCATION,
+        AgentCapability.RISK_ASSESSMENT,
+    )
+
     def __init__(self, agent_id: str = "agent_investment_001"):
         """Initialize the Investment Management Agent.
         
@@ -24,92 +64,59 @@ class InvestmentManagementAgent(Agent):
         super().__init__(
             agent_id=agent_id,
             name="Investment Manager",
-            capabilities=[
-                AgentCapability("portfolio_management"),
-                AgentCapability("investment_analysis"),
-                AgentCapability("asset_allocation"),
-                AgentCapability("risk_assessment")
-            ]
+            capabilities=list(self._CAPABILITIES)
         )
 
     async def initialize(self) -> None:
         """Initialize the agent."""
-        logger.info(f"{self.name} initialized")
-        self.state = {
+        await super().initialize()
+        _log_info(self._init_msg)
+        self.runtime_state = {
             "portfolios": {},
-            "initialized_at": datetime.now().isoformat()
+            "initialized_at": now_iso()
         }
 
-    async def execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute an investment management task.
-        
-        Args:
-            task: Task dictionary containing action and parameters
-            
-        Returns:
-            Result of the investment task
-        """
-        action = task.get("action", "")
-        
-        if action == "analyze_portfolio":
-            return await self._analyze_portfolio(task.get("data", {}))
-        elif action == "allocate_assets":
-            return await self._allocate_assets(task.get("data", {}))
-        elif action == "assess_risk":
-            return await self._assess_risk(task.get("data", {}))
-        elif action == "get_recommendations":
-            return await self._get_recommendations(task.get("data", {}))
-        else:
-            return {"error": f"Unknown action: {action}"}
-
-    async def _analyze_portfolio(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @action("analyze_portfolio")
+    def _analyze_portfolio(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze investment portfolio."""
-        portfolio_id = data.get("portfolio_id")
-        holdings = data.get("holdings", [])
+        try:
+            portfolio_id, holdings = _GET_ANALYZE_PORTFOLIO(data)
+        except KeyError:
+            portfolio_id = data.get("portfolio_id")
+            holdings = data.get("holdings", [])
         
         analysis = {
             "portfolio_id": portfolio_id,
             "total_holdings": len(holdings),
             "diversification_score": 0.75,
-            "performance_metrics": {
-                "ytd_return": 12.5,
-                "1_year_return": 8.3,
-                "3_year_return": 7.1
-            },
-            "analysis_timestamp": datetime.now().isoformat()
+            "performance_metrics": _PERFORMANCE_METRICS,
+            "analysis_timestamp": task_timestamp()
         }
         
-        logger.info(f"Portfolio analysis completed for {portfolio_id}")
+        _log_info("Portfolio analysis completed for %s", portfolio_id)
         return analysis
 
-    async def _allocate_assets(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @action("allocate_assets")
+    def _allocate_assets(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Allocate assets based on investment strategy."""
-        investment_amount = data.get("investment_amount", 0)
-        risk_profile = data.get("risk_profile", "moderate")
-        
-        # Asset allocation based on risk profile
-        allocations = {
-            "conservative": {"stocks": 0.30, "bonds": 0.60, "cash": 0.10},
-            "moderate": {"stocks": 0.60, "bonds": 0.30, "cash": 0.10},
-            "aggressive": {"stocks": 0.80, "bonds": 0.15, "cash": 0.05}
-        }
-        
-        allocation = allocations.get(risk_profile, allocations["moderate"])
+        try:
+            investment_amount, risk_profile = _GET_ALLOCATE_ASSETS(data)
+        except KeyError:
+            investment_amount = data.get("investment_amount", 0)
+            risk_profile = data.get("risk_profile", "moderate")
         
         allocation_result = {
             "investment_amount": investment_amount,
             "risk_profile": risk_profile,
-            "allocation": {
-                k: investment_amount * v 
-                for k, v in allocation.items()
-            },
-            "allocation_timestamp": datetime.now().isoformat()
+            "allocation": dict(_allocation_for(risk_profile, investment_amount)),
+            "allocation_timestamp": task_timestamp()
         }
         
-        logger.info(f"Asset allocation completed: {risk_profile}")
+        _log_info("Asset allocation completed: %s", risk_profile)
         return allocation_result
 
-    async def _assess_risk(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @action("assess_risk")
+    def _assess_risk(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Assess investment risk."""
         portfolio_value = data.get("portfolio_value", 0)
         
@@ -119,29 +126,27 @@ class InvestmentManagementAgent(Agent):
             "var_95": portfolio_value * 0.05,  # Value at risk
             "sharpe_ratio": 1.2,
             "beta": 0.95,
-            "assessment_timestamp": datetime.now().isoformat()
+            "assessment_timestamp": task_timestamp()
         }
         
-        logger.info("Risk assessment completed")
+        _log_info("Risk assessment completed")
         return risk_assessment
 
-    async def _get_recommendations(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @action("get_recommendations")
+    def _get_recommendations(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Get investment recommendations."""
         market_conditions = data.get("market_conditions", "neutral")
         
         recommendations = {
             "market_conditions": market_conditions,
-            "recommendations": [
-                {"action": "rebalance", "priority": "high", "reason": "Portfolio drift detected"},
-                {"action": "increase_exposure", "priority": "medium", "reason": "Bullish market signals"},
-                {"action": "hedge_position", "priority": "low", "reason": "Risk mitigation"}
-            ],
-            "recommendation_timestamp": datetime.now().isoformat()
+            "recommendations": _RECOMMENDATIONS,
+            "recommendation_timestamp": task_timestamp()
         }
         
-        logger.info("Investment recommendations generated")
+        _log_info("Investment recommendations generated")
         return recommendations
 
     async def shutdown(self) -> None:
         """Shutdown the agent."""
-        logger.info(f"{self.name} shutting down")
+        _log_info(self._shutdown_msg)
+        await super().shutdown()
@@ -3,64 +3,77 @@
 Specialized agent for marketing with Bytez, Brevo, and Skywork.ai integration.
 """
 
-import asyncio, logging
+import logging
 from typing import Dict, Any
-from datetime import datetime
-from ..agent_management import Agent, AgentCapability
+from operator import itemgetter
+from types import MappingProxyType
+from ..agent_management import Agent, AgentCapability, action
+from ._ids import IdSequence
+from ._time import now_iso, task_timestamp
 
 logger = logging.getLogger(__name__)
+_log_info = logger.info
+
+_SKYWORK_ENTITIES = ("brand", "product", "customer")
+_CAMPAIGN_METRICS = MappingProxyType({
+    "open_rate": 0.45,
+    "click_rate": 0.12,
+    "conversion_rate": 0.05,
+    "unsubscribe_rate": 0.01
+})
+
+_GET_SEND_EMAIL_CAMPAIGN = itemgetter("campaign_id", "recipients")
 
 class MarketingSpecialistAgent(Agent):
     """Agent for marketing with Bytez, Brevo, Skywork.ai integration."""
 
+    __slots__ = ("runtime_state",)
+
+    _campaign_ids = IdSequence("CAMP")
+
+    _CAPABILITIES = (
+        AgentCapability.CAMPAIGN_MANAGEMENT,
+        AgentCapability.EMAIL_MARKETING,
+        AgentCapability.CONTENT_ANALYSIS,
+        AgentCapability.MULTI_API_INTEGRATION,
+    )
+
     def __init__(self, agent_id: str = "agent_marketing_001"):
         super().__init__(
             agent_id=agent_id,
             name="Marketing Specialist",
-            capabilities=[
-                AgentCapability("campaign_management"),
-                AgentCapability("email_marketing"),
-                AgentCapability("content_analysis"),
-                AgentCapability("multi_api_integration")
-            ]
+            capabilities=list(self._CAPABILITIES)
         )
 
     async def initialize(self) -> None:
-        logger.info(f"{self.name} initialized")
-        self.state = {
+        await super().initialize()
+        _log_info(self._init_msg)
+        self.runtime_state = {
             "bytez_connected": False,
             "brevo_connected": False,
             "skywork_connected": False,
-            "initialized_at": datetime.now().isoformat()
+            "initialized_at": now_iso()
         }
 
-    async def execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        action = task.get("action", "")
-        if action == "create_campaign":
-            return await self._create_campaign(task.get("data", {}))
-        elif action == "send_email_campaign":
-            return await self._send_email_campaign(task.get("data", {}))
-        elif action == "analyze_content":
-            return await self._analyze_content(task.get("data", {}))
-        elif action == "track_performance":
-            return await self._track_performance(task.get("data", {}))
-        else:
-            return {"error": f"Unknown action: {action}"}
-
-    async def _create_campaign(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @action("create_campaign")
+    def _create_campaign(self, data: Dict[str, Any]) -> Dict[str, Any]:
         campaign_name = data.get("campaign_name")
         return {
-            "campaign_id": f"CAMP_{datetime.now().timestamp()}",
+            "campaign_id": self._campaign_ids(),
             "campaign_name": campaign_name,
             "status": "created",
             "bytez_document_processing": "enabled",
             "skywork_content_analysis": "enabled",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": task_timestamp()
         }
 
-    async def _send_email_campaign(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        campaign_id = data.get("campaign_id")
-        recipients = data.get("recipients", [])
+    @action("send_email_campaign")
+    def _send_email_campaign(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            campaign_id, recipients = _GET_SEND_EMAIL_CAMPAIGN(data)
+        except KeyError:
+            campaign_id = data.get("campaign_id")
+            recipients = data.get("recipients", [])
         return {
             "campaign_id": campaign_id,
             "recipients_count": len(recipients),
@@ -68,36 +81,34 @@ class MarketingSpecialistAgent(Agent):
             "brevo_api_status": "success",
             "brevo_message_id": f"MSG_{campaign_id}",
             "delivery_status": "sent",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": task_timestamp()
         }
 
-    async def _analyze_content(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @action("analyze_content")
+    def _analyze_content(self, data: Dict[str, Any]) -> Dict[str, Any]:
         content_text = data.get("content_text", "")
         return {
             "content_length": len(content_text),
             "analysis_result": "completed",
             "skywork_sentiment": "positive",
-            "skywork_entities": ["brand", "product", "customer"],
+            "skywork_entities": _SKYWORK_ENTITIES,
             "optimization_score": 0.88,
             "bytez_extraction": "completed",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": task_timestamp()
         }
 
-    async def _track_performance(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @action("track_performance")
+    def _track_performance(self, data: Dict[str, Any]) -> Dict[str, Any]:
         campaign_id = data.get("campaign_id")
         return {
             "campaign_id": campaign_id,
-            "metrics": {
-                "open_rate": 0.45,
-                "click_rate": 0.12,
-                "conversion_rate": 0.05,
-                "unsubscribe_rate": 0.01
-            },
+            "metrics": _CAMPAIGN_METRICS,
             "brevo_analytics": "synced",
             "skywork_insights": "generated",
             "bytez_document_count": 25,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": task_timestamp()
         }
 
     async def shutdown(self) -> None:
-        logger.info(f"{self.name} shutting down")
+        _log_info(self._shutdown_msg)
+        await super().shutdown()
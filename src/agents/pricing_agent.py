@@ -3,74 +3,100 @@
 Specialized agent for pricing analysis and strategy optimization.
 """
 
-import asyncio, logging
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Any
-from datetime import datetime
-from ..agent_management import Agent, AgentCapability
+from ..agent_management import Agent, AgentCapability, action
+from ._time import now_iso, task_timestamp
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class PriceOptimization:
+    """Result of a price optimization."""
+    product_id: Any
+    current_price: float
+    optimized_price: float
+    price_increase_percentage: int = 12
+    expected_revenue_increase: str = "18%"
+    timestamp: str
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class MarketAnalysis:
+    """Result of a market segment analysis."""
+    segment: Any
+    market_size: int = 50000000
+    growth_rate: float = 0.15
+    pricing_trends: str = "upward"
+    timestamp: str
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class CompetitiveAnalysis:
+    """Result of a competitor analysis."""
+    competitor: Any
+    price_comparison: str = "10% lower"
+    value_proposition: str = "superior"
+    recommendation: str = "maintain_premium_pricing"
+    timestamp: str
+
+
+
+@lru_cache(maxsize=1024)
+def _price_core(cost: float) -> tuple:
+    """Get (current price, optimized price) for a unit cost, memoized per cost."""
+    return cost * 2.5, cost * 2.8
+
+
 class PricingSpecialistAgent(Agent):
     """Agent for pricing optimization and strategy."""
 
+    __slots__ = ("runtime_state",)
+
+    _CAPABILITIES = (
+        AgentCapability.PRICE_OPTIMIZATION,
+        AgentCapability.MARKET_ANALYSIS,
+        AgentCapability.COMPETITIVE_POSITIONING,
+        AgentCapability.REVENUE_MAXIMIZATION,
+    )
+
     def __init__(self, agent_id: str = "agent_pricing_001"):
         super().__init__(
             agent_id=agent_id,
             name="Pricing Specialist",
-            capabilities=[
-                AgentCapability("price_optimization"),
-                AgentCapability("market_analysis"),
-                AgentCapability("competitive_positioning"),
-                AgentCapability("revenue_maximization")
-            ]
+            capabilities=list(self._CAPABILITIES)
         )
 
     async def initialize(self) -> None:
-        logger.info(f"{self.name} initialized")
-        self.state = {"pricing_models": 0, "initialized_at": datetime.now().isoformat()}
-
-    async def execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        action = task.get("action", "")
-        if action == "optimize_price":
-            return await self._optimize_price(task.get("data", {}))
-        elif action == "analyze_market":
-            return await self._analyze_market(task.get("data", {}))
-        elif action == "competitive_analysis":
-            return await self._competitive_analysis(task.get("data", {}))
-        else:
-            return {"error": f"Unknown action: {action}"}
-
-    async def _optimize_price(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        await super().initialize()
+        logger.info(self._init_msg)
+        self.runtime_state = {"pricing_models": 0, "initialized_at": now_iso()}
+
+    @action("optimize_price")
+    def _optimize_price(self, data: Dict[str, Any]) -> PriceOptimization:
         product_id = data.get("product_id")
         cost = data.get("cost", 0)
-        return {
-            "product_id": product_id,
-            "current_price": cost * 2.5,
-            "optimized_price": cost * 2.8,
-            "price_increase_percentage": 12,
-            "expected_revenue_increase": "18%",
-            "timestamp": datetime.now().isoformat()
-        }
-
-    async def _analyze_market(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        current_price, optimized_price = _price_core(cost)
+        return PriceOptimization(
+            product_id=product_id,
+            current_price=current_price,
+            optimized_price=optimized_price,
+            timestamp=task_timestamp()
+        )
+
+    @action("analyze_market")
+    def _analyze_market(self, data: Dict[str, Any]) -> MarketAnalysis:
         market_segment = data.get("market_segment")
-        return {
-            "segment": market_segment,
-            "market_size": 50000000,
-            "growth_rate": 0.15,
-            "pricing_trends": "upward",
-            "timestamp": datetime.now().isoformat()
-        }
-
-    async def _competitive_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return MarketAnalysis(segment=market_segment, timestamp=task_timestamp())
+
+    @action("competitive_analysis")
+    def _competitive_analysis(self, data: Dict[str, Any]) -> CompetitiveAnalysis:
         competitor_id = data.get("competitor_id")
-        return {
-            "competitor": competitor_id,
-            "price_comparison": "10% lower",
-            "value_proposition": "superior",
-            "recommendation": "maintain_premium_pricing",
-            "timestamp": datetime.now().isoformat()
-        }
+        return CompetitiveAnalysis(competitor=competitor_id, timestamp=task_timestamp())
 
     async def shutdown(self) -> None:
-        logger.info(f"{self.name} shutting down")
+        logger.info(self._shutdown_msg)
+        await super().shutdown()
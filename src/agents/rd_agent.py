@@ -3,84 +3,118 @@
 Specialized agent for R&D management with Bytez API integration.
 """
 
-import asyncio, logging
-from typing import Dict, List, Any
-from datetime import datetime
-from ..agent_management import Agent, AgentCapability
+import logging
+import orjson
+from dataclasses import dataclass
+from typing import Dict, Any, Tuple
+from ..agent_management import Agent, AgentCapability, action
+from ._ids import IdSequence
+from ._time import now_iso, task_timestamp
 
 logger = logging.getLogger(__name__)
 
+_KEY_INSIGHTS = (
+    "Technology trend analysis completed",
+    "Innovation gap identified",
+    "Competitive landscape mapped"
+)
+# JSON encoding of the insights, spliced into pre-serialized responses
+_KEY_INSIGHTS_B = orjson.dumps(_KEY_INSIGHTS)
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ResearchTask:
+    """A newly started research task."""
+    research_id: str
+    topic: Any
+    status: str = "in_progress"
+    bytez_document_processing: str = "active"
+    timestamp: str
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class FindingsAnalysis:
+    """Result of a research findings analysis."""
+    analysis_result: str = "completed"
+    key_insights: Tuple[str, ...] = _KEY_INSIGHTS
+    timestamp: str
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class InnovationStatus:
+    """Tracking status of an innovation."""
+    innovation_id: Any
+    stage: str = "active"
+    maturity_level: float = 0.75
+    timestamp: str
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ProjectStatus:
+    """Status of an R&D project."""
+    project_name: Any
+    status: str = "active"
+    progress: float = 0.65
+    timestamp: str
+
+
 class ResearchDevelopmentAgent(Agent):
     """Agent for R&D with Bytez integration."""
 
+    __slots__ = ("runtime_state",)
+
+    _research_ids = IdSequence("RES")
+
+    _CAPABILITIES = (
+        AgentCapability.RESEARCH_MANAGEMENT,
+        AgentCapability.INNOVATION_TRACKING,
+        AgentCapability.BYTEZ_DOCUMENT_ANALYSIS,
+        AgentCapability.PROJECT_COORDINATION,
+    )
+
     def __init__(self, agent_id: str = "agent_rd_001"):
         super().__init__(
             agent_id=agent_id,
             name="R&D Manager",
-            capabilities=[
-                AgentCapability("research_management"),
-                AgentCapability("innovation_tracking"),
-                AgentCapability("bytez_document_analysis"),
-                AgentCapability("project_coordination")
-            ]
+            capabilities=list(self._CAPABILITIES)
         )
 
     async def initialize(self) -> None:
-        logger.info(f"{self.name} initialized")
-        self.state = {"active_projects": 0, "initialized_at": datetime.now().isoformat()}
-
-    async def execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        action = task.get("action", "")
-        if action == "conduct_research":
-            return await self._conduct_research(task.get("data", {}))
-        elif action == "analyze_findings":
-            return await self._analyze_findings(task.get("data", {}))
-        elif action == "track_innovation":
-            return await self._track_innovation(task.get("data", {}))
-        elif action == "manage_project":
-            return await self._manage_project(task.get("data", {}))
-        else:
-            return {"error": f"Unknown action: {action}"}
-
-    async def _conduct_research(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        await super().initialize()
+        logger.info(self._init_msg)
+        self.runtime_state = {"active_projects": 0, "initialized_at": now_iso()}
+
+    @action("conduct_research")
+    def _conduct_research(self, data: Dict[str, Any]) -> ResearchTask:
         topic = data.get("topic")
-        return {
-            "research_id": f"RES_{datetime.now().timestamp()}",
-            "topic": topic,
-            "status": "in_progress",
-            "bytez_document_processing": "active",
-            "timestamp": datetime.now().isoformat()
-        }
-
-    async def _analyze_findings(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return ResearchTask(
+            research_id=self._research_ids(),
+            topic=topic,
+            timestamp=task_timestamp()
+        )
+
+    @action("analyze_findings")
+    def _analyze_findings(self, data: Dict[str, Any]) -> FindingsAnalysis:
         findings = data.get("findings", [])
-        return {
-            "analysis_result": "completed",
-            "key_insights": [
-                "Technology trend analysis completed",
-                "Innovation gap identified",
-                "Competitive landscape mapped"
-            ],
-            "timestamp": datetime.now().isoformat()
-        }
-
-    async def _track_innovation(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return FindingsAnalysis(timestamp=task_timestamp())
+
+    @action("analyze_findings", serialized=True)
+    def _analyze_findings_bytes(self, data: Dict[str, Any]) -> bytes:
+        return (
+            b'{"analysis_result":"completed","key_insights":' + _KEY_INSIGHTS_B
+            + b',"timestamp":' + orjson.dumps(task_timestamp()) + b"}"
+        )
+
+    @action("track_innovation")
+    def _track_innovation(self, data: Dict[str, Any]) -> InnovationStatus:
         innovation_id = data.get("innovation_id")
-        return {
-            "innovation_id": innovation_id,
-            "stage": "active",
-            "maturity_level": 0.75,
-            "timestamp": datetime.now().isoformat()
-        }
-
-    async def _manage_project(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return InnovationStatus(innovation_id=innovation_id, timestamp=task_timestamp())
+
+    @action("manage_project")
+    def _manage_project(self, data: Dict[str, Any]) -> ProjectStatus:
         project_name = data.get("project_name")
-        return {
-            "project_name": project_name,
-            "status": "active",
-            "progress": 0.65,
-            "timestamp": datetime.now().isoformat()
-        }
+        return ProjectStatus(project_name=project_name, timestamp=task_timestamp())
 
     async def shutdown(self) -> None:
-        logger.info(f"{self.name} shutting down")
+        logger.info(self._shutdown_msg)
+        await super().shutdown()
@@ -4,15 +4,28 @@ Core supervisor that manages agent coordination, task delegation, and orchestrat
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional
-from .agent_management import Agent, AgentRegistry, AgentCapability
+import sys
+from collections import deque
+from types import MappingProxyType
+from typing import Deque, Dict, Iterator, List, Any, Mapping, Optional, Tuple
+from .agent_management import Agent, AgentRegistry, result_as_dict
+from .agents._time import batch_timestamp, now_iso
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
 class SupervisorOrchestrator:
-    """Main supervisor for orchestrating multi-agent tasks."""
+    """Main supervisor for orchestrating multi-agent tasks.
+    
+    Tasks delegated in a batch through delegate_many() share one timestamp:
+    it is held in the batch_timestamp context variable while the batch runs,
+    and agent handlers stamp their responses with it instead of reading the
+    clock.
+    """
+
+    __slots__ = ("name", "registry", "_tasks", "_task_event", "running", "_cap_index", "_cap_index_ro", "_cap_rr")
 
     def __init__(self, name: str = "Supervisor"):
         """Initialize the supervisor.
@@ -22,8 +35,17 @@ class SupervisorOrchestrator:
         """
         self.name = name
         self.registry = AgentRegistry()
-        self.task_queue: asyncio.Queue = asyncio.Queue()
+        # Pending tasks for a single consumer; the event is set while any wait
+        self._tasks: Deque[Dict[str, Any]] = deque()
+        self._task_event = asyncio.Event()
         self.running = False
+        # Capability value (interned) -> agents offering it, in registration order
+        self._cap_index: Dict[str, List[Agent]] = {}
+        # Read-only snapshot of _cap_index taken by start(); dropped on any
+        # registration change so lookups fall back to the live index
+        self._cap_index_ro: Optional[Mapping[str, Tuple[Agent, ...]]] = None
+        # Capability value -> round-robin position in _cap_index
+        self._cap_rr: Dict[str, int] = {}
 
     def register_agent(self, agent: Agent) -> None:
         """Register an agent with the supervisor.
@@ -31,22 +53,97 @@ class SupervisorOrchestrator:
         Args:
             agent: Agent to register
         """
+        previous = self.registry.get_agent(agent.agent_id)
+        if previous is not None:
+            self._unindex_agent(previous)
         self.registry.register(agent)
-        logger.info(f"Agent {agent.name} registered with supervisor")
+        self._cap_index_ro = None
+        for capability in agent.capabilities:
+            self._cap_index.setdefault(sys.intern(capability.value), []).append(agent)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Agent %s registered with supervisor", agent.name)
+
+    def unregister_agent(self, agent_id: str) -> bool:
+        """Unregister an agent from the supervisor.
+        
+        Args:
+            agent_id: ID of agent to unregister
+            
+        Returns:
+            True if agent was unregistered, False if not found
+        """
+        agent = self.registry.get_agent(agent_id)
+        if agent is None:
+            return False
+        self.registry.unregister(agent_id)
+        self._unindex_agent(agent)
+        self._cap_index_ro = None
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Agent %s unregistered from supervisor", agent.name)
+        return True
+
+    def _unindex_agent(self, agent: Agent) -> None:
+        """Remove an agent from the capability index."""
+        for capability in agent.capabilities:
+            agents = self._cap_index.get(capability.value)
+            if agents is None:
+                continue
+            agents[:] = [a for a in agents if a is not agent]
+            if not agents:
+                del self._cap_index[capability.value]
 
     async def initialize_agents(self) -> None:
-        """Initialize all registered agents."""
+        """Initialize all registered agents concurrently.
+        
+        An agent that fails to initialize is logged without stopping the rest.
+        """
         agents = self.registry.list_all_agents()
-        for agent in agents:
-            await agent.initialize()
-        logger.info(f"Initialized {len(agents)} agents")
+        results = await asyncio.gather(
+            *(agent.initialize() for agent in agents), return_exceptions=True
+        )
+        self._log_failures(agents, results, "initialize")
+        logger.info("Initialized %s agents", len(agents))
 
     async def shutdown_agents(self) -> None:
-        """Shutdown all registered agents."""
+        """Shutdown all registered agents concurrently.
+        
+        An agent that fails to shut down is logged without stopping the rest.
+        """
         agents = self.registry.list_all_agents()
-        for agent in agents:
-            await agent.shutdown()
-        logger.info(f"Shutdown {len(agents)} agents")
+        results = await asyncio.gather(
+            *(agent.shutdown() for agent in agents), return_exceptions=True
+        )
+        self._log_failures(agents, results, "shutdown")
+        logger.info("Shutdown %s agents", len(agents))
+
+    @staticmethod
+    def _log_failures(agents, results, operation: str) -> None:
+        """Log the exceptions returned by a gather over agents."""
+        for agent, result in zip(agents, results):
+            if isinstance(result, BaseException):
+                logger.error("Agent %s failed to %s: %r", agent.name, operation, result)
+
+    def put_task(self, task: Dict[str, Any]) -> None:
+        """Queue a task for the consumer waiting in get_task().
+        
+        Args:
+            task: Task dictionary, as accepted by delegate_task()
+        """
+        self._tasks.append(task)
+        self._task_event.set()
+
+    async def get_task(self) -> Dict[str, Any]:
+        """Wait for and remove the oldest queued task.
+        
+        The queue has a single consumer; concurrent callers are not supported.
+        
+        Returns:
+            The task dictionary
+        """
+        while not self._tasks:
+            self._task_event.clear()
+            await self._task_event.wait()
+        return self._tasks.popleft()
 
     async def delegate_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Delegate a task to appropriate agent(s).
@@ -57,14 +154,54 @@ class SupervisorOrchestrator:
         Returns:
             Result dictionary from agent execution
         """
+        return await self._execute_one(task)
+
+    async def delegate_many(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Delegate a batch of independent tasks concurrently.
+        
+        Every task in the batch is stamped with the same timestamp.
+        
+        Args:
+            tasks: Task dictionaries, as accepted by delegate_task()
+            
+        Returns:
+            Result dictionaries in the same order as tasks; a task that
+            raised is reported as {"success": False, "error": ...}
+        """
+        # One log line for the whole batch rather than one per task
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Delegating batch of %s tasks", len(tasks))
+        # gather() wraps each task in an asyncio.Task, which copies the
+        # current context, so every task sees the batch timestamp
+        token = batch_timestamp.set(now_iso())
+        try:
+            results = await asyncio.gather(
+                *(self._execute_one(task, batched=True) for task in tasks),
+                return_exceptions=True
+            )
+        finally:
+            batch_timestamp.reset(token)
+        return [
+            {"success": False, "error": str(result)}
+            if isinstance(result, BaseException) else result
+            for result in results
+        ]
+
+    async def _execute_one(self, task: Dict[str, Any], batched: bool = False) -> Dict[str, Any]:
+        """Run a task on the next agent offering its capability.
+        
+        With batched=True the caller logs once for the whole batch, so the
+        per-task delegation line is skipped.
+        """
         required_capability = task.get('capability')
         if not required_capability:
             raise ValueError("Task must specify a capability")
         
         # Find agents with required capability
-        agents = self.registry.get_agents_by_capability(
-            AgentCapability(required_capability)
-        )
+        cap_index = self._cap_index_ro
+        if cap_index is None:
+            cap_index = self._cap_index
+        agents = cap_index.get(required_capability)
         
         if not agents:
             return {
@@ -72,37 +209,45 @@ class SupervisorOrchestrator:
                 "error": f"No agents available for capability: {required_capability}"
             }
         
-        # Use first available agent
-        agent = agents[0]
-        logger.info(f"Delegating task to agent {agent.name}")
+        # Rotate through the agents offering this capability
+        index = self._cap_rr.get(required_capability, 0) % len(agents)
+        self._cap_rr[required_capability] = index + 1
+        agent = agents[index]
+        if not batched and logger.isEnabledFor(logging.INFO):
+            logger.info("Delegating task to agent %s", agent.name)
         
         try:
             result = await agent.execute(task)
-            return {
-                "success": True,
-                "agent_id": agent.agent_id,
-                "agent_name": agent.name,
-                "result": result
-            }
         except Exception as e:
-            logger.error(f"Task execution failed: {str(e)}")
+            logger.error("Task execution failed: %s", e)
             return {
                 "success": False,
                 "error": str(e),
                 "agent_id": agent.agent_id
             }
+        return {
+            "success": True,
+            "agent_id": agent.agent_id,
+            "agent_name": agent.name,
+            "result": result_as_dict(result)
+        }
 
     async def start(self) -> None:
         """Start the supervisor."""
         self.running = True
         await self.initialize_agents()
-        logger.info(f"{self.name} started")
+        # The agent set rarely changes once running; serve lookups from a
+        # frozen snapshot until it does
+        self._cap_index_ro = MappingProxyType(
+            {cap: tuple(agents) for cap, agents in self._cap_index.items()}
+        )
+        logger.info("%s started", self.name)
 
     async def stop(self) -> None:
         """Stop the supervisor."""
         self.running = False
         await self.shutdown_agents()
-        logger.info(f"{self.name} stopped")
+        logger.info("%s stopped", self.name)
 
     def get_status(self) -> Dict[str, Any]:
         """Get supervisor status."""
@@ -111,3 +256,17 @@ class SupervisorOrchestrator:
             "running": self.running,
             "registry": self.registry.get_registry_status()
         }
+
+    def iter_status_json(self) -> Iterator[bytes]:
+        """Serialize the supervisor status incrementally.
+        
+        Yields:
+            Consecutive fragments of the JSON document returned by get_status()
+        """
+        yield (
+            b'{"supervisor":' + orjson.dumps(self.name)
+            + b',"running":' + orjson.dumps(self.running)
+            + b',"registry":'
+        )
+        yield from self.registry.iter_registry_status_json()
+        yield b"}"